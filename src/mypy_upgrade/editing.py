@@ -7,6 +7,12 @@ from collections.abc import Collection
 
 from mypy_upgrade.parsing import string_to_error_codes
 
+_ADD_RE = re.compile(r"# type\s*:\s*ignore(\[[a-z, \-]*\])?")
+_FORMAT_RE = re.compile(r"type\s*:\s*ignore(\[(?P<error_codes>[a-z, \-]*)\])?")
+_REMOVE_RE = re.compile(
+    r"#\s*type\s*:\s*ignore(\[(?P<error_code>[a-z, \-]+)\])?"
+)
+
 
 def add_type_ignore_comment(*, comment: str, error_codes: list[str]) -> str:
     """Add a `type: ignore` comment with error codes to in-line comment.
@@ -20,8 +26,12 @@ def add_type_ignore_comment(*, comment: str, error_codes: list[str]) -> str:
         A copy of the original comment with a `type: ignore[error-code]`
         comment added
     """
-    type_ignore = re.compile(r"# type\s*:\s*ignore(\[[a-z, \-]*\])?")
-    match = type_ignore.match(comment)
+    if not comment:
+        unique_codes = sorted({e for e in error_codes if e})
+        codes = f'[{", ".join(unique_codes)}]' if unique_codes else ""
+        return f"# type: ignore{codes}"
+
+    match = _ADD_RE.match(comment)
     existing_codes = string_to_error_codes(
         string=match.string if match else ""
     )
@@ -29,28 +39,25 @@ def add_type_ignore_comment(*, comment: str, error_codes: list[str]) -> str:
     error_codes = [e for e in error_codes if e]
     codes = f'[{", ".join(sorted({*error_codes}))}]' if error_codes else ""
     if match:
-        return type_ignore.sub(f"# type: ignore{codes}", comment).rstrip()
+        return _ADD_RE.sub(f"# type: ignore{codes}", comment).rstrip()
 
     return f"# type: ignore{codes} {comment}".rstrip()
 
 
+def _format_type_ignore_match(match: re.Match[str]) -> str:
+    """Format the `"type: ignore"` phrase matched by `_FORMAT_RE`."""
+    comma_separated_codes = (match.group("error_codes") or "").replace(" ", "")
+    error_codes = [e for e in comma_separated_codes.split(",") if e]
+    codes = f'[{", ".join(error_codes)}]' if error_codes else ""
+    return f"type: ignore{codes}"
+
+
 def format_type_ignore_comment(*, comment: str) -> str:
     """Remove excess whitespace and commas from a `"type: ignore"` comment."""
-    type_ignore = re.compile(
-        r"type\s*:\s*ignore(\[(?P<error_codes>[a-z, \-]*)\])?"
-    )
-    match = type_ignore.search(comment)
-
-    # Format existing error codes
-    if match is None:
+    if "type" not in comment:
         return comment.rstrip()
 
-    error_codes_section = match.group("error_codes") or ""
-    comma_separated_codes = error_codes_section.replace(" ", "")
-    error_codes = [e for e in comma_separated_codes.split(",") if e]
-
-    codes = f'[{", ".join(error_codes)}]' if error_codes else ""
-    return type_ignore.sub(f"type: ignore{codes}", comment, count=1).rstrip()
+    return _FORMAT_RE.sub(_format_type_ignore_match, comment, count=1).rstrip()
 
 
 def remove_unused_type_ignore_comments(
@@ -66,24 +73,27 @@ def remove_unused_type_ignore_comments(
     Returns:
         A copy of the original string with the specified error codes removed.
     """
-    if not any(code for code in codes_to_remove):
+    codes_to_remove = frozenset(code for code in codes_to_remove if code)
+    if not codes_to_remove:
         return comment
 
-    type_ignore = re.compile(
-        r"#\s*type\s*:\s*ignore(\[(?P<error_code>[a-z, \-]+)\])?"
-    )
-    match = type_ignore.search(comment)
+    match = _REMOVE_RE.search(comment)
     old_codes = match.group("error_code") if match is not None else ""
 
     if not old_codes:
         return comment
 
-    if "*" in codes_to_remove or all(
-        code.strip() in codes_to_remove for code in old_codes.split(",")
-    ):
-        return type_ignore.sub("", comment)
+    if "*" in codes_to_remove:
+        return _REMOVE_RE.sub("", comment)
+
+    kept_codes = [
+        code
+        for code in (c.strip() for c in old_codes.split(","))
+        if code and code not in codes_to_remove
+    ]
+    if not kept_codes:
+        return _REMOVE_RE.sub("", comment)
 
-    new_codes = old_codes
-    for code in codes_to_remove:
-        new_codes = new_codes.replace(code, "")
-    return type_ignore.sub(f"# type: ignore[{new_codes}]", comment, count=1)
+    return _REMOVE_RE.sub(
+        f'# type: ignore[{", ".join(kept_codes)}]', comment, count=1
+    )
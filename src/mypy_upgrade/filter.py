@@ -2,7 +2,9 @@
 # remove when dropping Python 3.7-3.9 support
 from __future__ import annotations
 
+import bisect
 import importlib.abc
+import os
 import pathlib
 import sys
 import tokenize
@@ -12,6 +14,45 @@ from typing import NamedTuple
 
 from mypy_upgrade.parsing import MypyError
 
+if sys.version_info >= (3, 12):
+    _STRING_TOKEN_TYPES = frozenset((tokenize.STRING, tokenize.FSTRING_MIDDLE))
+else:
+    _STRING_TOKEN_TYPES = frozenset((tokenize.STRING,))
+
+# A backslash followed by any line ending (or none, on the last line)
+_LINE_CONTINUATIONS = ("\\", "\\\n", "\\\r\n", "\\\r")
+
+
+def _get_module_path(module: str) -> pathlib.Path | None:
+    """Determine the file system path of a given module/package.
+
+    Args:
+        module: a string representing an (importable) module.
+
+    Returns:
+        A pathlib.Path object corresponding to the given module or ``None`` if
+        a path is not found for the module.
+
+    Raises:
+        NotImplementedError: Uncountered an unsupported module type.
+    """
+    spec = util.find_spec(module)
+    if spec is None:
+        return None
+
+    loader = spec.loader
+    if isinstance(loader, importlib.abc.ExecutionLoader):
+        module_path = pathlib.Path(loader.get_filename(module))
+        if loader.is_package(module):
+            module_path = module_path.parent
+    elif spec.origin == "frozen":
+        module_path = pathlib.Path(spec.loader_state.filename)
+    else:
+        msg = "Uncountered an unsupported module type."
+        raise NotImplementedError(msg)
+
+    return module_path
+
 
 def _get_module_paths(*, modules: list[str]) -> list[pathlib.Path | None]:
     """Determine file system paths of given modules/packages.
@@ -27,25 +68,12 @@ def _get_module_paths(*, modules: list[str]) -> list[pathlib.Path | None]:
     Raises:
         NotImplementedError: Uncountered an unsupported module type.
     """
-    paths: list[pathlib.Path | None] = []
-    for module in modules:
-        spec = util.find_spec(module)
-        if spec is None:
-            paths.append(None)
-        else:
-            loader = spec.loader
-            if isinstance(loader, importlib.abc.ExecutionLoader):
-                module_path = pathlib.Path(loader.get_filename(module))
-                if loader.is_package(module):
-                    module_path = module_path.parent
-            elif spec.origin == "frozen":
-                module_path = pathlib.Path(spec.loader_state.filename)
-            else:
-                msg = "Uncountered an unsupported module type."
-                raise NotImplementedError(msg)
-            paths.append(module_path)
-
-    return paths
+    # Resolve repeated modules once; nothing is kept between calls since
+    # modules may become importable later (e.g., after sys.path changes)
+    paths = {
+        module: _get_module_path(module) for module in dict.fromkeys(modules)
+    }
+    return [paths[module] for module in modules]
 
 
 def filter_by_source(
@@ -76,15 +104,22 @@ def filter_by_source(
     module_paths = [
         m for m in _get_module_paths(modules=modules) if m is not None
     ]
-    file_paths = [pathlib.Path(f).resolve() for f in files]
-    paths = package_paths + module_paths + file_paths
+    file_paths = [os.path.realpath(f) for f in files]
+    paths = [str(p) for p in package_paths + module_paths] + file_paths
+    include_exact = frozenset(paths)
+    include_prefixes = tuple(
+        path.rstrip(os.sep) + os.sep for path in include_exact
+    )
+    resolved_paths: dict[str, str] = {}
     selected = []
     for error in errors:
-        module_path = pathlib.Path(error.filename).resolve()
-        # ! Use Path.is_relative_to when dropping Python 3.7-3.8 support
-        should_include = any(
-            path in module_path.parents or path == module_path
-            for path in paths
+        module_path = resolved_paths.get(error.filename)
+        if module_path is None:
+            module_path = os.path.realpath(error.filename)
+            resolved_paths[error.filename] = module_path
+
+        should_include = module_path in include_exact or (
+            module_path.startswith(include_prefixes)
         )
 
         if should_include:
@@ -110,15 +145,11 @@ def filter_by_code(
         A list of `MypyError`s including only those with error codes in
         `codes_to_silence`.
     """
-    code_filtered_errors = list(errors)
-    if codes_to_silence is not None:
-        code_filtered_errors = [
-            error
-            for error in code_filtered_errors
-            if error.error_code in codes_to_silence
-        ]
+    if codes_to_silence is None:
+        return list(errors)
 
-    return code_filtered_errors
+    codes = frozenset(codes_to_silence)
+    return [error for error in errors if error.error_code in codes]
 
 
 class UnsilenceableRegion(NamedTuple):
@@ -153,7 +184,8 @@ def _find_unsilenceable_regions(
             each line in the source from which `tokens` is generated.
 
     Returns:
-        A list of `UnsilenceableRegion` objects.
+        A list of unique `UnsilenceableRegion` objects sorted by their
+        `start` and `end` attributes.
 
         Multiline strings are represented by `UnsilenceableRegion` objects
         whose first entries in their `start` and `end` attributes differ.
@@ -161,36 +193,36 @@ def _find_unsilenceable_regions(
         objects whose first entries in their `start` and `end` attributes are
         the same.
     """
-    unsilenceable_regions: set[UnsilenceableRegion] = set()
-    for token in tokens:
-        if token.start[0] != token.end[0] and (
-            token.exact_type == tokenize.STRING
-            or (
-                sys.version_info >= (3, 12)
-                and token.exact_type == tokenize.FSTRING_MIDDLE
-            )
-        ):
-            region = UnsilenceableRegion(token.start[0], token.end[0])
-            unsilenceable_regions.add(region)
-        elif (
-            token.line.rstrip("\r\n").endswith("\\")
-            and not comments[token.end[0] - 1]
-        ):
-            region = UnsilenceableRegion(token.end[0], token.end[0])
-            unsilenceable_regions.add(region)
+    unsilenceable_regions: list[UnsilenceableRegion] = []
+    last_line = ""
+    continued = False
+    for token_type, _, (start, _), (end, _), line in tokens:
+        # Tokens on the same physical line share it, so only check it once
+        if line != last_line:
+            last_line = line
+            continued = line.endswith(_LINE_CONTINUATIONS)
+
+        if start != end and token_type in _STRING_TOKEN_TYPES:
+            region = UnsilenceableRegion(start, end)
+            unsilenceable_regions.append(region)
+        elif continued and not comments[end - 1]:
+            region = UnsilenceableRegion(end, end)
+            unsilenceable_regions.append(region)
 
-    return list(unsilenceable_regions)
+    return sorted(dict.fromkeys(unsilenceable_regions))
 
 
 def _is_safe_to_silence(
-    *, error: MypyError, unsilenceable_regions: Iterable[UnsilenceableRegion]
+    *, error: MypyError, unsilenceable_regions: Sequence[UnsilenceableRegion]
 ) -> bool:
     """Determine if the error is safe to silence
 
     Args:
         error: a `MypyError` for which a type error suppression comment is to
             placed.
-        unsilenceable_regions: an iterable of `UnsilenceableRegion`s.
+        unsilenceable_regions: a sequence of `UnsilenceableRegion`s sorted by
+            their `start` attribute (e.g., as returned by
+            `_find_unsilenceable_regions`).
 
     Returns:
         `False` if the error is in an `UnsilenceableRegion` or its error code
@@ -199,13 +231,21 @@ def _is_safe_to_silence(
     if error.error_code == "syntax":
         return False
 
-    for region in unsilenceable_regions:
-        # Error within an UnsilenceableRegion (but not last line of multiline
-        # string)
-        if region.start <= error.line_no <= region.end and not (
-            error.line_no == region.end and region.start != region.end
-        ):
-            return False
+    # Only regions starting at or before the error can contain it
+    i = bisect.bisect_right(
+        unsilenceable_regions, (error.line_no, sys.maxsize)
+    )
+    while i > 0:
+        i -= 1
+        region = unsilenceable_regions[i]
+        if region.start == region.end:
+            # Explicitly continued lines only contain their own line
+            if region.start == error.line_no:
+                return False
+        else:
+            # Multiline strings are disjoint, so only the last one starting
+            # at or before the error can contain it (but not on its last line)
+            return error.line_no >= region.end
 
     return True
 
@@ -230,11 +270,24 @@ def filter_by_silenceability(
     unsilenceable_regions = _find_unsilenceable_regions(
         tokens=tokens, comments=comments
     )
+    if not unsilenceable_regions:
+        return [error for error in errors if error.error_code != "syntax"]
+
+    # Errors often share lines, so only check each line number once
+    safe_lines: dict[int, bool] = {}
     safe_to_silence = []
     for error in errors:
-        if _is_safe_to_silence(
-            error=error, unsilenceable_regions=unsilenceable_regions
-        ):
+        if error.error_code == "syntax":
+            continue
+
+        is_safe = safe_lines.get(error.line_no)
+        if is_safe is None:
+            is_safe = _is_safe_to_silence(
+                error=error, unsilenceable_regions=unsilenceable_regions
+            )
+            safe_lines[error.line_no] = is_safe
+
+        if is_safe:
             safe_to_silence.append(error)
 
     return safe_to_silence
@@ -27,6 +27,10 @@ class ColouredFormatter(logging.Formatter):
         colours: "dict[int, int] | None" = None,
     ) -> None:
         self.colours = colours or DEFAULT_COLOURS
+        self._wraps = {
+            level: (f"\033[1;{colour_code}m", "\033[0m")
+            for level, colour_code in self.colours.items()
+        }
         if sys.version_info < (3, 8):
             super().__init__(fmt, datefmt, style)
         elif sys.version_info < (3, 10):
@@ -37,5 +41,5 @@ class ColouredFormatter(logging.Formatter):
             )
 
     def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
-        colour_code = self.colours[record.levelno]
-        return f"\033[1;{colour_code}m{self._style.format(record)}\033[0m"
+        prefix, suffix = self._wraps[record.levelno]
+        return prefix + self._style.format(record) + suffix
@@ -2,8 +2,11 @@
 # remove when dropping Python 3.7-3.9 support
 from __future__ import annotations
 
+import functools
 import logging
 import re
+import sys
+from operator import attrgetter
 from typing import NamedTuple, TextIO
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,17 @@ MISSING_ERROR_CODES = (
     "--allow-no-error-codes flag for mypy-upgrade."
 )
 
+_REPORT_RE = re.compile(
+    r"^[^\S\n]*(?P<filename>[^:\n]+):(?P<line_no>\d+)(:(?P<col_offset>\d+))?"
+    r"(:\d+:\d+)?: error: (?:(?P<message>.+)[^\S\n]\[(?P<error_code>.+)\]"
+    r"|(?P<message_without_code>.+))[^\S\n]*$",
+    re.ASCII | re.MULTILINE,
+)
+
+_TYPE_IGNORE_RE = re.compile(
+    r"type\s*:\s*ignore\s*(?:\[(?P<error_code>[a-z, \-]+)\])?", re.ASCII
+)
+
 
 class MypyError(NamedTuple):
     """A mypy error
@@ -57,6 +71,9 @@ def parse_mypy_report(
 ) -> list[MypyError]:
     """Parse a mypy error report from stdin.
 
+    The report is read in its entirety. If the stream is seekable, it is
+    then returned to its original position.
+
     Args:
         report: a text stream from which to read the mypy typing report
     Returns:
@@ -66,40 +83,52 @@ def parse_mypy_report(
         Example::
 
             >> report = pathlib.Path('mypy_report.txt').open(encoding='utf-8')
-            >> errors = parse_report(report)
-            >> module, col_offset, line_no, message , error_code= errors[0]
+            >> errors = parse_mypy_report(report=report)
+            >> errors[0].filename, errors[0].line_no, errors[0].error_code
     """
-    start = report.tell()
-    info = re.compile(
-        r"^(?P<filename>[^:]+):(?P<line_no>\d+)(:(?P<col_offset>\d+))?"
-        r"(:\d+:\d+)?: error: (?P<message>.+)\s+(\[(?P<error_code>.+)\])?"
-    )
-    errors = []
-
-    for line in report:
-        error = info.match(line.strip())
-        if error:
-            error_code = error.group("error_code") or ""
-            filename, message = error.group("filename", "message")
-            line_no = int(error.group("line_no"))
-            if error.group("col_offset"):
-                col_offset = int(error.group("col_offset"))
-            else:
-                col_offset = None
-
-            errors.append(
-                MypyError(
+    start = report.tell() if report.seekable() else None
+    data = report.read()
+    if start is not None:
+        report.seek(start)
+
+    # Bucket errors by file so that only line numbers need to be sorted
+    errors_by_file: dict[str, list[MypyError]] = {}
+    for match in _REPORT_RE.finditer(data):
+        # One groups() call is cheaper than a group() call per field
+        (
+            filename,
+            line_no,
+            _,
+            col_offset,
+            _,
+            message,
+            error_code,
+            message_without_code,
+        ) = match.groups()
+        # Errors share few distinct filenames and codes, so store one copy
+        filename = sys.intern(filename)
+        errors_by_file.setdefault(filename, []).append(
+            # _make() skips the keyword handling of the generated __new__
+            MypyError._make(
+                (
                     filename,
-                    line_no,
-                    col_offset,
-                    message.strip(),
-                    error_code,
+                    int(line_no),
+                    int(col_offset) if col_offset else None,
+                    (message or message_without_code).strip(),
+                    sys.intern(error_code or ""),
                 )
             )
-    report.seek(start)
+        )
+
+    errors: list[MypyError] = []
+    for filename in sorted(errors_by_file):
+        file_errors = errors_by_file[filename]
+        file_errors.sort(key=attrgetter("line_no"))
+        errors.extend(file_errors)
+
     if any(not error.error_code for error in errors):
         logger.warning(MISSING_ERROR_CODES)
-    return sorted(errors, key=MypyError.filename_and_line_number)
+    return errors
 
 
 def string_to_error_codes(*, string: str) -> tuple[str, ...]:
@@ -123,16 +152,39 @@ def string_to_error_codes(*, string: str) -> tuple[str, ...]:
         >>> string_to_error_codes(string=string)
         ("operator", "type-var")
     """
-    type_ignore_re = re.compile(
-        r"type\s*:\s*ignore\s*(?:\[(?P<error_code>[a-z, \-]+)\])?"
-    )
+    return _string_to_error_codes(string)
+
+
+@functools.lru_cache(maxsize=2048)
+def _string_to_error_codes(string: str) -> tuple[str, ...]:
+    """Cached implementation of `string_to_error_codes`.
+
+    Mypy repeats the same messages across many errors, so each distinct
+    message is only scanned once.
+
+    Args:
+        string: a string containing "type: ignore"
+
+    Returns:
+        A tuple of strings, each of which is a mypy error code.
+    """
+    if "type" not in string:
+        return ()
+
     # Extract unused type ignore error codes from error description
-    code_match = type_ignore_re.findall(string)
-    type_ignore_re.search(string)
-    if code_match:
-        error_codes = max(code_match)
-        if error_codes:
-            # Separate and trim
-            return tuple({code.strip() for code in error_codes.split(",")})
+    error_codes = ""
+    most_codes = -1
+    for match in _TYPE_IGNORE_RE.finditer(string):
+        codes = match.group("error_code") or ""
+        # Whitespace-only entries are not error codes
+        num_codes = sum(1 for code in codes.split(",") if code.strip())
+        if num_codes > most_codes:
+            error_codes, most_codes = codes, num_codes
+
+    if error_codes:
+        # Separate, trim and de-duplicate, preserving order
+        return tuple(
+            dict.fromkeys(code.strip() for code in error_codes.split(","))
+        )
 
     return ()
@@ -106,21 +106,20 @@ def _extract_error_details(
     descriptions_to_add: list[str] = []
     codes_to_remove: list[str] = []
     for error in errors:
+        if error.error_code not in ("unused-ignore", "ignore-without-code"):
+            codes_to_add.append(error.error_code)
+            descriptions_to_add.append(error.message)
+            continue
+
         codes_in_message = string_to_error_codes(string=error.message) or (
             "*",
         )
-        if error.error_code == "unused-ignore" or (
-            # 0 error codes in error.message = unused `type: ignore`
-            error.error_code == "ignore-without-code"
-            and "*" in codes_in_message
-        ):
+        # 0 error codes in error.message = unused `type: ignore`
+        if error.error_code == "unused-ignore" or "*" in codes_in_message:
             codes_to_remove.extend(codes_in_message)
-        elif error.error_code == "ignore-without-code":
-            codes_to_add.extend(codes_in_message)
-            descriptions_to_add.extend("No message" for _ in codes_in_message)
         else:
-            codes_to_add.append(error.error_code)
-            descriptions_to_add.append(error.message)
+            codes_to_add.extend(codes_in_message)
+            descriptions_to_add.extend(["No message"] * len(codes_in_message))
 
     return codes_to_add, descriptions_to_add, codes_to_remove
 
@@ -144,8 +143,13 @@ def create_suppression_comment(
         fix_me: a string specifying a "fix me" message to be appended after the
             silencing comment.
     Returns:
-        A type error suppression comment.
+        A type error suppression comment. If `errors` is empty, `comment` is
+        returned unchanged.
     """
+    errors = list(errors)
+    if not errors:
+        return comment
+
     to_add, descriptions, to_remove = _extract_error_details(errors=errors)
     pruned_comment = remove_unused_type_ignore_comments(
         comment=comment, codes_to_remove=to_remove
@@ -167,18 +171,15 @@ def create_suppression_comment(
 def _writelines(*, file: TextIO, lines: Iterable[CommentSplitLine]) -> int:
     """Write an iterable of `CommentSplitLine`s to a file."""
     to_write = []
-    for line in lines:
-        if line.code and line.comment:
-            if line.code.endswith(" ") and not line.comment.startswith(
-                "# type: ignore"
-            ):
-                to_write.append(f"{line.code}{line.comment}")
-            else:
-                to_write.append(f"{line.code.rstrip()}  {line.comment}")
-        elif line.code:
-            to_write.append(line.code)
+    for code, comment in lines:
+        if not comment:
+            to_write.append(code)
+        elif not code:
+            to_write.append(comment)
+        elif code.endswith(" ") and not comment.startswith("# type: ignore"):
+            to_write.append(f"{code}{comment}")
         else:
-            to_write.append(line.comment)
+            to_write.append(f"{code.rstrip()}  {comment}")
     return file.write("\n".join(to_write))
 
 
@@ -186,6 +187,7 @@ def _log_silencing_results(
     *, errors: Iterable[MypyError], safe_to_silence: Iterable[MypyError]
 ) -> None:
     """Logs the results of a call to `silence_errors_in_file`"""
+    safe_to_silence = set(safe_to_silence)
     warned = False
     for error in errors:
         if error in safe_to_silence:
@@ -234,6 +236,9 @@ def silence_errors_in_file(
         A list of `MypyError`s which were silenced in the given file.
     """
     errors = list(errors)
+    if not errors:
+        return []
+
     start = file.tell()
     raw_code = file.read()
     tokens = list(tokenize.generate_tokens(io.StringIO(raw_code).readline))
@@ -256,7 +261,8 @@ def silence_errors_in_file(
 
     file.seek(start)
 
-    if not dry_run:
+    # Leave the file untouched if there is nothing to silence
+    if safe_to_silence and not dry_run:
         _ = _writelines(file=file, lines=lines)
         _ = file.truncate()
     _log_silencing_results(errors=errors, safe_to_silence=safe_to_silence)
@@ -337,8 +343,13 @@ def silence_errors_in_report(
         except tokenize.TokenError:
             logger.warning(f"Unable to tokenize file: {filename}")
 
+    # Sets make the membership tests below linear in the number of errors
+    silenced_set = set(silenced)
+    code_filtered_set = set(code_filtered_errors)
     return MypyUpgradeResult(
-        silenced=(*silenced,),
-        failures=tuple(e for e in code_filtered_errors if e not in silenced),
-        ignored=tuple(e for e in errors if e not in code_filtered_errors),
+        silenced=tuple(silenced),
+        failures=tuple(
+            e for e in code_filtered_errors if e not in silenced_set
+        ),
+        ignored=tuple(e for e in errors if e not in code_filtered_set),
     )
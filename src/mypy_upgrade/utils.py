@@ -30,11 +30,14 @@ def split_into_code_and_comment(
     code_lines = source.splitlines()
     comments = [""] * len(code_lines)
 
-    for token in tokens:
-        if token.exact_type == tokenize.COMMENT:
-            line = token.start[0] - 1
-            comments[line] = token.string
-            code_lines[line] = code_lines[line][: token.start[1]]
+    # Every comment contains "#", so only scan the tokens if there is one
+    if "#" in source:
+        for token_type, string, (start, col_offset), _, _ in tokens:
+            # COMMENT is not an operator, so its type is also its exact type
+            if token_type == tokenize.COMMENT:
+                line = start - 1
+                comments[line] = string
+                code_lines[line] = code_lines[line][:col_offset]
 
     lines = [
         CommentSplitLine(code, comment)
@@ -64,3 +64,24 @@ class TestAllCombinations:
     @staticmethod
     def test_should_not_add_empty_error_codes(final_comment: str) -> None:
         assert "# type: ignore[]" not in final_comment
+
+
+class TestEmptyComment:
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("error_codes", "expected"),
+        [
+            ([], "# type: ignore"),
+            ([""], "# type: ignore"),
+            (["override"], "# type: ignore[override]"),
+            (
+                ["override", "arg-type", "override"],
+                "# type: ignore[arg-type, override]",
+            ),
+        ],
+    )
+    def test_should_create_type_ignore_comment(
+        error_codes: list[str], expected: str
+    ) -> None:
+        comment = add_type_ignore_comment(comment="", error_codes=error_codes)
+        assert comment == expected
@@ -137,3 +137,20 @@ def test_should_trim_repeating_comment_characters(
         comment=type_ignore_stub + comment_suffix
     )
     assert not formatted_type_ignore_comment.startswith("##")
+
+
+@pytest.mark.parametrize(
+    "type_ignore_comment",
+    [
+        "type : ignore[override, type-arg]",
+        "type:ignore[override,type-arg]",
+        "type: ignore[ override , type-arg ]",
+    ],
+)
+def test_should_normalize_non_canonical_type_ignore_comments(
+    type_ignore_comment: str,
+) -> None:
+    assert (
+        format_type_ignore_comment(comment=type_ignore_comment)
+        == "type: ignore[override, type-arg]"
+    )
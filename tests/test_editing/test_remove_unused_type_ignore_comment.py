@@ -95,3 +95,32 @@ class TestAllCombinations:
                 comment=comment, codes_to_remove=["*"]
             )
             assert not result.startswith("# type: ignore")
+
+
+@pytest.mark.parametrize(
+    ("comment", "codes_to_remove", "expected"),
+    [
+        (
+            "# type: ignore[arg-type, override] # noqa",
+            ["override"],
+            "# type: ignore[arg-type] # noqa",
+        ),
+        (
+            "# type: ignore[arg-type, attr-defined, override]",
+            ["attr-defined", "union-attr"],
+            "# type: ignore[arg-type, override]",
+        ),
+        (
+            "# type: ignore[explicit-override, override]",
+            ["override"],
+            "# type: ignore[explicit-override]",
+        ),
+    ],
+)
+def test_should_remove_only_whole_error_codes(
+    comment: str, codes_to_remove: list[str], expected: str
+) -> None:
+    result = remove_unused_type_ignore_comments(
+        comment=comment, codes_to_remove=codes_to_remove
+    )
+    assert result == expected
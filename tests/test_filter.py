@@ -12,6 +12,7 @@ import pytest
 from mypy_upgrade.filter import (
     UnsilenceableRegion,
     _find_unsilenceable_regions,
+    _get_module_path,
     _get_module_paths,
     _is_safe_to_silence,
     filter_by_code,
@@ -73,6 +74,21 @@ class TestGetModulePaths:
         message = "Uncountered an unsupported module type."
         assert exc_info.value.args[0] == message
 
+    @staticmethod
+    def test_should_resolve_repeated_modules_once() -> None:
+        paths = _get_module_paths(modules=["mypy_upgrade", "mypy_upgrade"])
+        assert paths[0] is paths[1]
+
+    @staticmethod
+    def test_should_find_module_made_importable_after_lookup(
+        tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        assert _get_module_path("late_module") is None
+        module_path = tmp_path.joinpath("late_module.py")
+        module_path.write_text("", encoding="utf-8")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        assert _get_module_path("late_module") == module_path
+
 
 @pytest.fixture(
     name="packages_to_include",
@@ -341,6 +357,15 @@ class TestFilterByCode:
         )
         assert filtered_errors == errors_to_filter
 
+    @staticmethod
+    def test_should_accept_one_shot_iterable_of_error_codes() -> None:
+        errors = [MypyError("", 1, 0, "", "arg-type")] * 2
+        filtered_errors = filter_by_code(
+            errors=errors,
+            codes_to_silence=(code for code in ["arg-type"]),
+        )
+        assert filtered_errors == errors
+
 
 class TestFindUnsilenceableRegions:
     @staticmethod
@@ -446,6 +471,25 @@ class TestIsSafeToSilence:
         )
         assert not safe_to_silence
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("line_no", "expected"),
+        [(1, False), (2, False), (3, True), (4, False), (5, True), (6, True)],
+    )
+    def test_should_check_all_sorted_regions(
+        line_no: int, expected: bool  # noqa: FBT001
+    ) -> None:
+        error = MypyError("", line_no, 0, "", "")
+        regions = [
+            UnsilenceableRegion(1, 3),
+            UnsilenceableRegion(2, 2),
+            UnsilenceableRegion(4, 5),
+        ]
+        safe_to_silence = _is_safe_to_silence(
+            error=error, unsilenceable_regions=regions
+        )
+        assert safe_to_silence is expected
+
     @staticmethod
     def test_should_return_false_for_syntax_error() -> None:
         error = MypyError("", 1, 0, "", "syntax")
@@ -1,13 +1,20 @@
 # remove when dropping Python 3.7-3.9 support
 from __future__ import annotations
 
+import io
+import os
 import re
 import typing
 from itertools import combinations, product
 
 import pytest
 
-from mypy_upgrade.parsing import MypyError, string_to_error_codes
+from mypy_upgrade.parsing import (
+    MypyError,
+    _string_to_error_codes,
+    parse_mypy_report,
+    string_to_error_codes,
+)
 
 
 class TestParseReport:
@@ -66,6 +73,35 @@ class TestParseReport:
 
         assert all(increasing_within_group)
 
+    @staticmethod
+    def test_should_parse_error_code_and_message() -> None:
+        report = io.StringIO(
+            "module.py:1:5: error: Incompatible types  [assignment]\n"
+            "module.py:1:5: note: See documentation\n"
+            "module.py:2: error: Function is missing a type annotation\n"
+            "Found 2 errors in 1 file (checked 1 source file)\n"
+        )
+        errors = parse_mypy_report(report=report)
+        assert errors == [
+            MypyError("module.py", 1, 5, "Incompatible types", "assignment"),
+            MypyError(
+                "module.py",
+                2,
+                None,
+                "Function is missing a type annotation",
+                "",
+            ),
+        ]
+
+    @staticmethod
+    def test_should_read_report_from_pipe() -> None:
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"module.py:1: error: Message  [misc]\n")
+        os.close(write_fd)
+        with open(read_fd, encoding="utf-8") as report:  # noqa: PTH123
+            errors = parse_mypy_report(report=report)
+        assert errors == [MypyError("module.py", 1, None, "Message", "misc")]
+
 
 MESSAGE_STUBS = [
     'Unused "type: ignore<placeholder>" comment',
@@ -129,3 +165,33 @@ class TestStringToErrorCodes:
         assert sorted(string_to_error_codes(string=message)) == sorted(
             error_codes
         )
+
+    @staticmethod
+    def test_should_return_error_codes_from_phrase_with_more_error_codes() -> (
+        None
+    ):
+        message = (
+            '"type: ignore" comment without error code (consider '
+            '"type: ignore[arg-type, attr-defined]" instead or '
+            '"type: ignore[union-attr]")'
+        )
+        assert sorted(string_to_error_codes(string=message)) == [
+            "arg-type",
+            "attr-defined",
+        ]
+
+    @staticmethod
+    def test_should_not_count_blank_error_codes() -> None:
+        string = ",-type: ignore [  ]# type: ignore[type]"
+        assert string_to_error_codes(string=string) == ("type",)
+
+    @staticmethod
+    def test_should_cache_error_codes() -> None:
+        string = 'Unused "type: ignore[operator, type-var]" comment'
+        codes = string_to_error_codes(string=string)
+        assert codes is _string_to_error_codes(string)
+
+    @staticmethod
+    def test_should_preserve_order_of_error_codes() -> None:
+        string = 'Unused "type: ignore[type-var, operator, type-var]" comment'
+        assert string_to_error_codes(string=string) == ("type-var", "operator")
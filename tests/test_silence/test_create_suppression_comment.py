@@ -149,3 +149,14 @@ class TestCreateSuppressionComment:
         )
         if suggested_codes:
             assert all(code in suppression_comment for code in suggested_codes)
+
+    @staticmethod
+    def test_should_return_comment_unchanged_without_errors() -> None:
+        comment = "# type:ignore[misc]  # a comment"
+        suppression_comment = create_suppression_comment(
+            comment=comment,
+            errors=[],
+            description_style="full",
+            fix_me="FIXME",
+        )
+        assert suppression_comment == comment
@@ -194,6 +194,21 @@ class TestAddErrorCodes:
         file.seek(start)
 
 
+class TestNothingToSilence:
+    @staticmethod
+    def test_should_not_rewrite_file_without_silenceable_errors() -> None:
+        code = "x = 1\\\n+i\n"
+        file = io.StringIO(code)
+        silenced_errors = silence_errors_in_file(
+            file=file,
+            errors=[MypyError("", 1, 1, 'Name "i" is not defined', "")],
+            description_style="full",
+            fix_me="",
+        )
+        assert silenced_errors == []
+        assert file.getvalue() == code
+
+
 ERROR_CODES = ["assignment", "arg-type", "used-before-def"]
 CODE_COMBINATIONS = [*permutations(ERROR_CODES, r=2), ERROR_CODES]
 